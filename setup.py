@@ -44,5 +44,8 @@ setup(
     install_requires=[
        'jsonrpcclient==3.3.6'
     ],
+    extras_require={
+        'orjson': ['orjson'],
+    },
     python_requires='>3.4.0',
 )
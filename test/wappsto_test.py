@@ -7,6 +7,9 @@ import re
 import os
 import math
 import json
+import time
+import logging
+import threading
 import pytest
 import wappsto
 import zipfile
@@ -64,7 +67,7 @@ def fake_connect(self, address, port, send_trace=False):
         context.connect = Mock(side_effect=check_for_correct_conn)
         with patch('time.sleep', return_value=None), \
             patch('threading.Thread'), \
-            patch('threading.Timer'), \
+            patch('wappsto.modules.value.period_scheduler'), \
             patch('wappsto.communication.ClientSocket.add_id_to_confirm_list'), \
             patch('wappsto.Wappsto.keep_running'), \
             patch('socket.socket'), \
@@ -407,6 +410,264 @@ class TestJsonLoadClass:
         # Assert
         assert (object_exists and result is not None) or (not object_exists and result is None)
 
+    @pytest.mark.parametrize("object_name", ["network", "device", "value", "control_state", "report_state"])
+    def test_get_by_id_after_delete(self, object_name):
+        """
+        Tests getting deleted element by id.
+
+        Looks the element up, deletes it and checks that it is no longer found.
+
+        Args:
+            object_name: name of the object to be deleted
+
+        """
+        # Arrange
+        self.service = wappsto.Wappsto(json_file_name=self.test_json_location)
+        get_object(self, "network").conn = Mock()
+        actual_object = get_object(self, object_name)
+        id = actual_object.uuid
+        assert self.service.get_by_id(id) is actual_object
+
+        # Act
+        actual_object.delete()
+        result = self.service.get_by_id(id)
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.parametrize("object_name", ["device", "value"])
+    def test_delete_keeps_old_list(self, object_name):
+        """
+        Tests deleting element while holding the old list.
+
+        Deletes the element and checks that it is removed from the parent,
+        while a list retrieved before the deletion still contains it.
+
+        Args:
+            object_name: name of the object to be deleted
+
+        """
+        # Arrange
+        self.service = wappsto.Wappsto(json_file_name=self.test_json_location)
+        get_object(self, "network").conn = Mock()
+        actual_object = get_object(self, object_name)
+        parent = actual_object.parent
+        list_name = "devices" if object_name == "device" else "values"
+        old_list = getattr(parent, list_name)
+
+        # Act
+        actual_object.delete()
+
+        # Assert
+        assert actual_object in old_list
+        assert actual_object not in getattr(parent, list_name)
+
+    def test_get_by_id_after_add_value(self):
+        """
+        Tests getting added value by id.
+
+        Looks up an element, adds a new value and checks that it is found.
+
+        """
+        # Arrange
+        self.service = wappsto.Wappsto(json_file_name=self.test_json_location)
+        device = get_object(self, "device")
+        id = "b9e3a8b4-43c7-4a9c-9e1c-6b2f43b5a1ff"
+        assert self.service.get_by_id(id) is None
+        value = wappsto.modules.value.Value(
+            parent=device,
+            uuid=id,
+            name="added",
+            type_of_value="test",
+            data_type="number",
+            permission="r",
+            number_max=100,
+            number_min=0,
+            number_step=1,
+            number_unit=None,
+            string_encoding=None,
+            string_max=None,
+            blob_encoding=None,
+            blob_max=None,
+            period=None,
+            delta=None
+        )
+
+        # Act
+        device.add_value(value)
+        result = self.service.get_by_id(id)
+
+        # Assert
+        assert result is value
+
+    @pytest.mark.parametrize("replace_with_none", [True, False])
+    def test_get_by_id_after_network_replaced(self, replace_with_none):
+        """
+        Tests getting element by id after the network is replaced.
+
+        Looks up an element, replaces the network and checks that the lookup
+        follows the new network.
+
+        Args:
+            replace_with_none: Boolean indicating if the network should be replaced with None
+
+        """
+        # Arrange
+        self.service = wappsto.Wappsto(json_file_name=self.test_json_location)
+        id = get_object(self, "value").uuid
+        old_value = self.service.get_by_id(id)
+        assert old_value is not None
+
+        # Act
+        if replace_with_none:
+            self.service.data_manager.network = None
+        else:
+            self.service.data_manager.read_file()
+        result = self.service.get_by_id(id)
+
+        # Assert
+        if replace_with_none:
+            assert result is None
+        else:
+            assert result is get_object(self, "value")
+            assert result is not old_value
+
+    @pytest.mark.parametrize("change", ["append", "remove", "uuid"])
+    def test_get_by_id_after_list_changed(self, change):
+        """
+        Tests getting element by id after the network is changed directly.
+
+        Looks up an element, changes the lists or uuids of the network
+        directly, and checks that the lookup follows the change.
+
+        Args:
+            change: how the network should be changed
+
+        """
+        # Arrange
+        self.service = wappsto.Wappsto(json_file_name=self.test_json_location)
+        device = get_object(self, "device")
+        value = get_object(self, "value")
+        old_id = value.uuid
+        new_id = "b9e3a8b4-43c7-4a9c-9e1c-6b2f43b5a1ff"
+        assert self.service.get_by_id(old_id) is value
+
+        # Act
+        if change == "append":
+            value = wappsto.modules.value.Value(
+                parent=device,
+                uuid=new_id,
+                name="appended",
+                type_of_value="test",
+                data_type="number",
+                permission="r",
+                number_max=100,
+                number_min=0,
+                number_step=1,
+                number_unit=None,
+                string_encoding=None,
+                string_max=None,
+                blob_encoding=None,
+                blob_max=None,
+                period=None,
+                delta=None
+            )
+            device.values.append(value)
+        elif change == "remove":
+            device.values.remove(value)
+        else:
+            value.uuid = new_id
+        result = self.service.get_by_id(new_id)
+
+        # Assert
+        assert result is (None if change == "remove" else value)
+        if change != "append":
+            assert self.service.get_by_id(old_id) is None
+
+    @pytest.mark.parametrize("warm_index", [True, False])
+    def test_get_by_id_duplicate(self, warm_index):
+        """
+        Tests getting element by id when the id is used twice.
+
+        Tests if the first element with the id is returned.
+
+        Args:
+            warm_index: Boolean indicating if the id index should be built before the id is repeated
+
+        """
+        # Arrange
+        self.service = wappsto.Wappsto(json_file_name=self.test_json_location)
+        values = get_object(self, "device").values
+        if warm_index:
+            self.service.get_by_id(values[0].uuid)
+
+        # Act
+        values[1].uuid = values[0].uuid
+        result = self.service.get_by_id(values[0].uuid)
+
+        # Assert
+        assert result is values[0]
+
+    def test_detached_objects(self):
+        """
+        Tests adding objects that are not part of a network.
+
+        Tests if values and states can be added to a device that is not
+        part of a network.
+
+        """
+        # Arrange
+        device = wappsto.modules.device.Device(
+            parent=None,
+            uuid=None,
+            name="detached",
+            product=None,
+            protocol=None,
+            serial_number=None,
+            version=None,
+            manufacturer=None,
+            communication=None,
+            description=None
+        )
+        value = wappsto.modules.value.Value(
+            parent=device,
+            uuid=None,
+            name="detached",
+            type_of_value="test",
+            data_type="number",
+            permission="w",
+            number_max=100,
+            number_min=0,
+            number_step=1,
+            number_unit=None,
+            string_encoding=None,
+            string_max=None,
+            blob_encoding=None,
+            blob_max=None,
+            period=None,
+            delta=None
+        )
+        states = [
+            wappsto.modules.state.State(
+                parent=value,
+                uuid=None,
+                state_type=state_type,
+                timestamp=None,
+                init_value=1
+            )
+            for state_type in ["Report", "Control"]
+        ]
+
+        # Act
+        device.add_value(value)
+        value.add_report_state(states[0])
+        value.add_control_state(states[1])
+
+        # Assert
+        assert device.values == [value]
+        assert value.report_state is states[0]
+        assert value.control_state is states[1]
+
     @pytest.mark.parametrize("save_as_string", [True, False])
     def test_load_existing_instance(self, save_as_string):
         """
@@ -440,6 +701,76 @@ class TestJsonLoadClass:
         # Assert
         assert saved_network == self.service.data_manager.get_encoded_network()
 
+    @pytest.mark.parametrize("temp_file_exists", [True, False])
+    def test_save_and_load_instance(self, temp_file_exists):
+        """
+        Tests saving and loading instance.
+
+        Saves the instance and then tries to load it, also when a newer
+        temporary file is left in the saved instances folder.
+
+        Args:
+            temp_file_exists: Boolean indicating if a newer temporary file should exist
+
+        """
+        # Arrange
+        self.service = wappsto.Wappsto(json_file_name=self.test_json_location)
+        get_object(self, "report_state").data = "42"
+        saved_network = self.service.data_manager.get_encoded_network()
+        path = self.service.data_manager.saved_instances_path
+        path_open = os.path.join(path, os.path.basename(self.test_json_location))
+        temp_path = os.path.join(path, "newer.json.tmp")
+
+        # Act
+        self.service.data_manager.save_instance()
+        if temp_file_exists:
+            with open(temp_path, "w") as temp_file:
+                temp_file.write('{"data": ')
+        try:
+            self.service = wappsto.Wappsto(json_file_name=self.test_json_location, load_from_state_file=True)
+        finally:
+            if temp_file_exists:
+                os.remove(temp_path)
+            os.remove(path_open)
+
+        # Assert
+        assert self.service.data_manager.json_file_name == path_open
+        assert saved_network == self.service.data_manager.get_encoded_network()
+        assert not os.path.exists(path_open + ".tmp")
+
+    @pytest.mark.parametrize("data_type,valid", [
+        ("number", True),
+        ("string", True),
+        ("blob", True),
+        ("unknown", False)])
+    def test_encode_value(self, caplog, data_type, valid):
+        """
+        Tests encoding value.
+
+        Tests if the details of the data type are encoded before the meta,
+        and left out with a warning if the data type is unknown.
+
+        Args:
+            data_type: data type of the value
+            valid: if the data type is known
+
+        """
+        # Arrange
+        self.service = wappsto.Wappsto(json_file_name=self.test_json_location)
+        value = get_object(self, "value")
+        value.data_type = data_type
+        expected_keys = ["name", "type", "permission", "state", "meta"]
+        if valid:
+            expected_keys.insert(4, data_type)
+
+        # Act
+        with caplog.at_level(logging.WARNING):
+            result = self.service.data_manager.wappsto_encoder.encode_value(value)
+
+        # Assert
+        assert list(result) == expected_keys
+        assert ("Value type '{}' is invalid".format(data_type) in caplog.text) != valid
+
 
 class TestConnClass:
     """
@@ -670,10 +1001,11 @@ class TestValueSendClass:
         with patch('urllib.request.urlopen') as urlopen:
             try:
                 if period is True and delta is None:
-                    with patch('threading.Timer.start') as start:
+                    with patch('wappsto.modules.value.period_scheduler') as scheduler:
                         value.set_period(1)
+                        value.enable_period()
                         value.timer_elapsed = True
-                        if start.called:
+                        if scheduler.enter.called:
                             value.update(input)
                 else:
                     value.update(input)
@@ -702,6 +1034,188 @@ class TestValueSendClass:
         else:
             assert urlopen_trace_id == ''
 
+    @pytest.mark.parametrize("input,number_min,step_size,valid", [
+        (8, -100, 1, True),  # integral min and step
+        (8.5, -100, 1, False),
+        (4, -100, 2, True),
+        (3, -100, 2, False),
+        (-8, -100, -1, True),
+        (4, -100.0, 2.0, True),
+        (1, -100, 0.5, True),  # decimal steps
+        (2.002, -100, 0.0002, True),
+        (-2.002, -100, 0.0002, True),
+        (2.0021, -100, 0.0002, False),
+        (0.3, -100, 0.1, True),
+        (0.35, -100, 0.1, False),
+        (2, -100, 1.0e-07, True),
+        (1.05, -99.95, 0.1, True),  # decimal min
+        (1.1, -99.95, 0.1, False),
+        (0.5, -100, 1.0e-12, True),  # very small steps
+        (1, -100, 9.0e-20, True),
+        (5, -100, float("nan"), False)])  # not a number step
+    @pytest.mark.parametrize("reassign", [True, False])
+    def test_value_step_check(self, input, number_min, step_size, valid, reassign):
+        """
+        Tests checking the step size of number value.
+
+        Tests if the value is validated against the given min and step, both
+        when they are given on creation and when they are set afterwards.
+
+        Args:
+            input: value to be checked
+            number_min: minimum number a value can have
+            step_size: step size value should follow
+            valid: if the value should pass the check
+            reassign: Boolean indicating if min and step should be set after creation
+
+        """
+        # Arrange
+        device = get_object(self, "device")
+        if reassign:
+            value = get_object(self, "value")
+            value.number_min = number_min
+            value.number_step = step_size
+        else:
+            value = wappsto.modules.value.Value(
+                parent=device,
+                uuid=None,
+                name="step",
+                type_of_value="test",
+                data_type="number",
+                permission="rw",
+                number_max=100,
+                number_min=number_min,
+                number_step=step_size,
+                number_unit=None,
+                string_encoding=None,
+                string_max=None,
+                blob_encoding=None,
+                blob_max=None,
+                period=None,
+                delta=None
+            )
+        err_msg = []
+
+        # Act
+        value._validate_value_data(input, err_msg)
+
+        # Assert
+        assert (err_msg == []) == valid
+
+    @pytest.mark.parametrize("data_type,new_data_type,input,expected,valid", [
+        ("string", "number", "abc", "NA", False),
+        ("string", "number", "0.3", "0.3", True),
+        ("string", "number", "0.35", "0.35", False),
+        ("number", "string", "abc", "abc", True),
+        ("number", "blob", "abc", "abc", True),
+        ("number", "unknown", "abc", None, False)])
+    def test_value_data_type_changed(self, data_type, new_data_type, input, expected, valid):
+        """
+        Tests validating value after its data type is changed.
+
+        Tests if the value is validated against the new data type, and not
+        the one it was created with.
+
+        Args:
+            data_type: data type the value is created with
+            new_data_type: data type the value is changed to
+            input: value to be checked
+            expected: value expected to be returned by the validation
+            valid: if the value should pass the check
+
+        """
+        # Arrange
+        value = wappsto.modules.value.Value(
+            parent=get_object(self, "device"),
+            uuid=None,
+            name="type",
+            type_of_value="test",
+            data_type=data_type,
+            permission="rw",
+            number_max=100,
+            number_min=-100,
+            number_step=0.1,
+            number_unit=None,
+            string_encoding=None,
+            string_max=None,
+            blob_encoding=None,
+            blob_max=None,
+            period=None,
+            delta=None
+        )
+        err_msg = []
+
+        # Act
+        value.data_type = new_data_type
+        result = value._validate_value_data(input, err_msg)
+
+        # Assert
+        assert value.data_type == new_data_type
+        assert result == expected
+        assert (err_msg == []) == valid
+
+    @pytest.mark.parametrize("input,max,expected", [
+        ("abc", "3", "abc"),
+        ("abcd", "3", None),
+        ("abcd", None, "abcd")])
+    @pytest.mark.parametrize("type", ["string", "blob"])
+    def test_value_max_set_as_string(self, input, max, expected, type):
+        """
+        Tests validating value after its max is set as a string.
+
+        Tests if a max given as a string is converted, when it is set
+        after creation.
+
+        Args:
+            input: value to be checked
+            max: maximum length of the value, as a string
+            expected: value expected to be returned by the validation
+            type: type of value
+
+        """
+        # Arrange
+        device = get_object(self, "device")
+        value = next(val for val in device.values if val.data_type == type)
+
+        # Act
+        value.string_max = max
+        value.blob_max = max
+        result = value._validate_value_data(input)
+
+        # Assert
+        assert result == expected
+        assert value.string_max == value.blob_max == (int(max) if max is not None else None)
+
+    @pytest.mark.parametrize("attr,deprecated", [
+        ("last_controlled", True),
+        ("unknown_attribute", False)])
+    def test_value_getattr(self, attr, deprecated):
+        """
+        Tests getting attribute that does not exist on value.
+
+        Tests if deprecated attributes are resolved with a warning, and
+        unknown attributes raise AttributeError.
+
+        Args:
+            attr: name of the attribute
+            deprecated: Boolean indicating if the attribute is deprecated
+
+        """
+        # Arrange
+        value = get_object(self, "value")
+
+        # Act
+        if deprecated:
+            with pytest.warns(UserWarning, match=attr):
+                result = getattr(value, attr)
+        else:
+            with pytest.raises(AttributeError, match=attr):
+                result = getattr(value, attr)
+
+        # Assert
+        if deprecated:
+            assert result == value.get_control_state().data
+
     @pytest.mark.parametrize("input,max,expected", [
         ("test", 10, "test"),  # value under max
         ("", 10, ""),
@@ -752,10 +1266,11 @@ class TestValueSendClass:
         with patch('urllib.request.urlopen') as urlopen:
             try:
                 if period is True:
-                    with patch('threading.Timer.start') as start:
+                    with patch('wappsto.modules.value.period_scheduler') as scheduler:
                         value.set_period(1)
+                        value.enable_period()
                         value.timer_elapsed = True
-                        if start.called:
+                        if scheduler.enter.called:
                             value.update(input)
                 else:
                     value.update(input)
@@ -782,6 +1297,193 @@ class TestValueSendClass:
         else:
             assert urlopen_trace_id == ''
 
+    @pytest.mark.parametrize("inputs,delta,expected", [
+        ([1, 2, 7, 8, 20], None, ["1", "2", "7", "8", "20"]),
+        ([1, 2, 7, 8, 20], 5, ["1", "7", "20"]),
+        ([1, 2, 3], 100, ["1"]),
+        ([], 5, [])])
+    def test_send_value_update_batch(self, inputs, delta, expected):
+        """
+        Tests sending a batch of updates for number value.
+
+        Tests if only the samples passing the delta check are being sent.
+
+        Args:
+            inputs: values to be updated
+            delta: delta of value (determines if change was significant enough to be sent)
+            expected: values expected to be sent
+
+        """
+        # Arrange
+        get_object(self, "network").conn = Mock()
+        value = get_object(self, "value")
+        if delta:
+            value.set_delta(delta)
+
+        # Act
+        result = value.update_batch(inputs)
+
+        # Assert
+        sending_queue = get_object(self, "network").conn.sending_queue
+        assert result == len(expected)
+        assert [args[0].data for args, kwargs in sending_queue.put.call_args_list] == expected
+
+    @pytest.mark.parametrize("inputs,timestamps,expected", [
+        ((x for x in [1, 2, 3]), None, ["1", "2", "3"]),
+        ([1, 2, 3], (t for t in ["a", "b", "c"]), ["1", "2", "3"]),
+        ([1, 2, 3], ["a", "b"], []),
+        ([1, 2], ["a", "b", "c"], [])])
+    def test_send_value_update_batch_timestamps(self, inputs, timestamps, expected):
+        """
+        Tests sending a batch of updates with timestamps.
+
+        Tests that any iterable is accepted, and that nothing is sent if
+        the number of timestamps does not match the number of values.
+
+        Args:
+            inputs: values to be updated
+            timestamps: timestamps of the values
+            expected: values expected to be sent
+
+        """
+        # Arrange
+        get_object(self, "network").conn = Mock()
+        value = get_object(self, "value")
+
+        # Act
+        result = value.update_batch(inputs, timestamps)
+
+        # Assert
+        sending_queue = get_object(self, "network").conn.sending_queue
+        assert result == len(expected)
+        assert [args[0].data for args, kwargs in sending_queue.put.call_args_list] == expected
+
+    @pytest.mark.parametrize("input,delta,period,timer_elapsed,expected", [
+        (5, None, None, False, True),  # nothing set, always sent
+        ("NA", None, None, False, True),
+        (5, 10, None, False, False),  # change under delta
+        (20, 10, None, False, True),  # change over delta
+        (5, None, 1, False, False),  # period not elapsed
+        (5, None, 1, True, True),  # period elapsed
+        (5, 10, 1, True, True)])
+    def test_check_delta_and_period(self, input, delta, period, timer_elapsed, expected):
+        """
+        Tests checking delta and period of a value.
+
+        Tests if the value should be sent, with the given delta and period.
+
+        Args:
+            input: value to be checked
+            delta: delta of value (determines if change was significant enough to be sent)
+            period: parameter indicating whether value should be updated periodically
+            timer_elapsed: Boolean indicating if the period has elapsed
+            expected: expected result of the check
+
+        """
+        # Arrange
+        value = get_object(self, "value")
+        value.last_update_of_report = 0
+        if delta:
+            value.set_delta(delta)
+        value.period = period
+        value.timer_elapsed = timer_elapsed
+
+        # Act
+        result = value.check_delta_and_period(input)
+
+        # Assert
+        assert result is expected
+
+    @pytest.mark.parametrize("failing_action", [True, False])
+    def test_period_scheduler(self, failing_action):
+        """
+        Tests running period timers.
+
+        Tests if a timer fires, also after an earlier timer action failed.
+
+        Args:
+            failing_action: Boolean indicating if an earlier timer action should raise
+
+        """
+        # Arrange
+        scheduler = wappsto.modules.value.PeriodScheduler()
+        fired = threading.Event()
+        if failing_action:
+            scheduler.enter(0, Mock(side_effect=ValueError))
+
+        # Act
+        scheduler.enter(0.01, fired.set)
+
+        # Assert
+        assert fired.wait(5)
+        assert scheduler.thread.is_alive()
+
+    def test_period_scheduler_cancel(self):
+        """
+        Tests canceling a period timer.
+
+        Tests if a canceled timer do not fire.
+
+        """
+        # Arrange
+        scheduler = wappsto.modules.value.PeriodScheduler()
+        action = Mock()
+        fired = threading.Event()
+        event = scheduler.enter(0.05, action)
+
+        # Act
+        scheduler.cancel(event)
+        scheduler.enter(0.1, fired.set)
+
+        # Assert
+        assert fired.wait(5)
+        assert not action.called
+
+    def test_value_period(self):
+        """
+        Tests the period of a value.
+
+        Tests if the period timer of a value fires.
+
+        """
+        # Arrange
+        value = get_object(self, "value")
+        value.period = 0.01
+
+        # Act
+        with patch('wappsto.modules.value.period_scheduler', wappsto.modules.value.PeriodScheduler()):
+            value.enable_period()
+            for _ in range(500):
+                if value.timer_elapsed:
+                    break
+                time.sleep(0.01)
+            value.disable_period()
+
+        # Assert
+        assert value.timer_elapsed
+        assert value.timer is None
+
+    def test_value_disable_period(self):
+        """
+        Tests disabling the period of a value.
+
+        Tests if disabling the period cancels its timer.
+
+        """
+        # Arrange
+        value = get_object(self, "value")
+        value.set_period(1)
+
+        # Act
+        with patch('wappsto.modules.value.period_scheduler') as scheduler:
+            value.enable_period()
+            value.disable_period()
+
+        # Assert
+        scheduler.enter.assert_called_once()
+        scheduler.cancel.assert_called_once_with(scheduler.enter.return_value)
+        assert value.timer is None
+
     def teardown_module(self):
         """
         Teardown each method.
@@ -899,7 +1601,7 @@ class TestReceiveThreadClass:
         try:
             # runs until mock object is run and its side_effect raises
             # exception
-            with patch('threading.Timer.start'):
+            with patch('wappsto.modules.value.period_scheduler'):
                 self.service.socket.receive_data.receive_thread()
         except KeyboardInterrupt:
             pass
@@ -1829,3 +2531,64 @@ class TestSendThreadClass:
 
         # Assert
         assert parsed_id == trace_id
+
+    @pytest.mark.parametrize("data,expected", [
+        ({"x": [{"a": None}, {"b": None}, {"c": 1}]}, {"x": [{"c": 1}]}),
+        ({"x": [{"a": None}, {"b": {"c": None}}, {"d": 1}]}, {"x": [{"d": 1}]}),
+        ({"x": [{"a": None}, {"b": None}], "y": 1}, {"y": 1}),
+        ({"x": [{"a": None}, {"b": None}]}, {})])
+    def test_get_object_without_none_values(self, data, expected):
+        """
+        Tests removing None values from object.
+
+        Tests if all emptied elements of a list are removed, also when two
+        of them follow each other.
+
+        Args:
+            data: object to remove None values from
+            expected: object expected after removing None values
+
+        """
+        # Arrange
+        test_json_location = os.path.join(os.path.dirname(__file__), TEST_JSON)
+        self.service = wappsto.Wappsto(json_file_name=test_json_location)
+        fake_connect(self, ADDRESS, PORT)
+
+        # Act
+        self.service.socket.get_object_without_none_values(data)
+
+        # Assert
+        assert data == expected
+
+    @pytest.mark.parametrize("data,expected", [
+        ([{"a": None}, {"b": None}, {"c": 1}], [{"c": 1}]),
+        ([{"a": None}, {"b": {"c": None}}, {"d": 1}], [{"d": 1}]),
+        ([{"x": [{"a": None}, {"b": None}, {"c": 1}]}], [{"x": [{"c": 1}]}]),
+        ([{"a": None}, {"b": None}], None)])
+    def test_send_data_without_none_values(self, data, expected):
+        """
+        Tests sending data with None values.
+
+        Tests if all emptied elements are removed before sending, also when
+        two of them follow each other.
+
+        Args:
+            data: data to be sent
+            expected: data expected to be sent, None if nothing should be sent
+
+        """
+        # Arrange
+        test_json_location = os.path.join(os.path.dirname(__file__), TEST_JSON)
+        self.service = wappsto.Wappsto(json_file_name=test_json_location)
+        fake_connect(self, ADDRESS, PORT)
+        self.service.socket.my_socket.sendall = Mock()
+
+        # Act
+        self.service.socket.send_data.send_data(data)
+
+        # Assert
+        sendall = self.service.socket.my_socket.sendall
+        if expected is None:
+            assert not sendall.called
+        else:
+            assert json.loads(sendall.call_args[0][0].decode("utf-8")) == expected
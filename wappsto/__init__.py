@@ -18,6 +18,8 @@ from .connection import event_storage
 from . import status
 from .data_operation import data_manager
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
 
 RETRY_LIMIT = 5
 warnings.warn("Project is deprecated. Please use https://github.com/Wappsto/python-wappsto-iot instead.", DeprecationWarning)
@@ -80,8 +82,7 @@ class Wappsto:
                 (default: {DAY_PERIOD})
 
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
 
         # TODO(Dimitar): Comment on this later.
         stack = inspect.stack()[1][1]
@@ -142,7 +143,9 @@ class Wappsto:
         """
         Wappsto devices.
 
-        Retrieves the devices list containing instances of devices
+        Retrieves the devices list containing instances of devices.
+        The list is replaced when a device is deleted, so a list retrieved
+        earlier does not reflect the deletion.
 
         Returns:
             A list of devices.
@@ -20,6 +20,9 @@ from ..errors import wappsto_errors
 
 from .import seluxit_rpc
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+
 PACKET_TIMEOUT = 10
 
 
@@ -52,8 +55,7 @@ class ClientSocket:
             event_storage: instance of event log.
 
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
         self.data_manager = data_manager
         self.path_to_calling_file = path_to_calling_file
         self.ssl_server_cert = os.path.join(path_to_calling_file,
@@ -215,11 +217,11 @@ class ClientSocket:
         message = seluxit_rpc.get_rpc_whole_json(self.data_manager.get_encoded_network(), trace_id)
         self.send_data.create_bulk(message)  # TODO(MBK): This is not conformed.
 
-        msg = "The whole network {} added to Sending queue {}.".format(
+        self.wapp_log.debug(
+            "The whole network %s added to Sending queue %s.",
             self.data_manager.network.name,
             self.sending_queue
         )
-        self.wapp_log.debug(msg)
 
         self.confirm_initialize_all()
 
@@ -335,8 +337,7 @@ class ClientSocket:
             elif isinstance(val, list):
                 for val_element in val:
                     self.get_object_without_none_values(val_element)
-                    if len(val_element) == 0:
-                        val.remove(val_element)
+                val[:] = [val_element for val_element in val if len(val_element) > 0]
                 if len(val) == 0:
                     del encoded_object[key]
 
@@ -350,11 +351,7 @@ class ClientSocket:
 
         for device in self.data_manager.network.devices:
             for value in device.values:
-                if value.timer.is_alive():
-                    msg = "Value: {} is no longer periodically sending updates."
-                    msg = msg.format(value.uuid)
-                    self.wapp_log.debug(msg)
-                value.timer.cancel()
+                value.disable_period()
 
         self.connected = False
         if self.my_socket:
@@ -22,6 +22,8 @@ import logging
 import datetime
 from json.decoder import JSONDecodeError
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
 
 REMOVE_OLD = 1
 REMOVE_RECENT = 2
@@ -57,8 +59,7 @@ class OfflineEventStorage:
             ServerConnectionException: "Unable to connect to the server.
 
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
 
         self.log_offline = log_offline
         self.log_data_limit = log_data_limit
@@ -232,7 +233,7 @@ class OfflineEventStorage:
                     self.compact_logs()
                 with open(file_path, "a") as file:
                     file.write(string_data + " \n")
-                self.wapp_log.debug("Raw log Json: {}".format(string_data))
+                self.wapp_log.debug("Raw log Json: %s", string_data)
             else:
                 self.wapp_log.debug("Log limit exeeded.")
                 if self.limit_action == REMOVE_OLD:
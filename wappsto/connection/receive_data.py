@@ -11,6 +11,9 @@ import logging
 from . import message_data
 from json.decoder import JSONDecodeError
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+
 # RECEIVE_SIZE = 1024
 RECEIVE_SIZE = 2048
 MESSAGE_SIZE_BYTES = 1000000
@@ -30,8 +33,7 @@ class ReceiveData:
             client_socket: reference to ClientSocket instance.
 
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
 
         self.client_socket = client_socket
 
@@ -115,7 +117,7 @@ class ReceiveData:
                     break
             else:
                 break
-        self.wapp_log.debug('Received Json: {}'.format(decoded))
+        self.wapp_log.debug('Received Json: %s', decoded)
         return decoded
 
     def receive_message(self, fail_on_error=False):
@@ -91,7 +91,8 @@ def get_rpc_fail_response(message_id, text):
 
 def time_stamp():
     """Return The default timestamp used for Wappsto."""
-    return datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    # NOTE: Same format as '%Y-%m-%dT%H:%M:%S.%fZ', without strftime.
+    return datetime.datetime.utcnow().isoformat(timespec='microseconds') + 'Z'
 
 
 def is_upgradable():
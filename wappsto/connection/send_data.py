@@ -15,6 +15,8 @@ import urllib.request as request
 from . import message_data
 from . import seluxit_rpc
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
 
 MAX_BULK_SIZE = 10
 t_url = 'https://tracer.iot.seluxit.com/trace?id={}&parent={}&name={}&status={}'  # noqa: E501
@@ -35,8 +37,7 @@ class SendData:
             automatic_trace: indicates if all messages automaticaly send trace.
 
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
 
         self.client_socket = client_socket
         self.automatic_trace = automatic_trace
@@ -115,9 +116,7 @@ class SendData:
         try:
             for data_element in data:
                 self.client_socket.get_object_without_none_values(data_element)
-                if len(data_element) == 0:
-                    self.wapp_log.debug('Removing data element of length 0: {}'.format(data_element))
-                    data.remove(data_element)  # WARNING(MBK): Do not remove from list when looping over it.
+            data = [data_element for data_element in data if len(data_element) > 0]
 
             if self.client_socket.connected:
                 for data_element in data:
@@ -127,7 +126,7 @@ class SendData:
                     data = json.dumps(data)
                     data = data.encode('utf-8')
                     self.client_socket.my_socket.sendall(data)
-                    self.wapp_log.debug('Raw Json Sent: {}'.format(data))
+                    self.wapp_log.debug('Raw Json Sent: %s', data)
             else:
                 self.wapp_log.warning("Data added to storage!")
                 self.client_socket.event_storage.add_message(data)
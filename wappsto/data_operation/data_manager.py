@@ -7,9 +7,43 @@ import os
 import json
 import logging
 import warnings
+import collections
 from . import encoder
 from . import decoder
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+
+TEMP_SUFFIX = '.tmp'
+
+IdIndex = collections.namedtuple('IdIndex', ['network', 'objects'])
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# NOTE: orjson is an optional speedup. It takes the raw bytes of the file
+#       and raises orjson.JSONDecodeError, which is a json.JSONDecodeError.
+json_loads = json.loads if orjson is None else orjson.loads
+
+
+def json_dumps(data):
+    """Encode data as JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+_warned_attributes = set()
+
+
+def warn_deprecated(attr):
+    """Warn that a deprecated attribute is used, once per attribute."""
+    if attr not in _warned_attributes:
+        _warned_attributes.add(attr)
+        warnings.warn("Property {} is deprecated".format(attr), stacklevel=3)
+
 
 class DataManager:
     """
@@ -36,13 +70,15 @@ class DataManager:
             path_to_calling_file: The path to files location.
 
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
         self.wappsto_encoder = encoder.WappstoEncoder()
         self.wappsto_decoder = decoder.WappstoDecoder()
+        self.id_index = None
 
         self.path_to_calling_file = path_to_calling_file
         self.json_file_name = os.path.join(self.path_to_calling_file, json_file_name)
+        self.saved_instances_path = os.path.join(self.path_to_calling_file, 'saved_instances')
+        os.makedirs(self.saved_instances_path, exist_ok=True)
 
         if load_from_state_file:
             json_file_name = self.get_latest_instance()
@@ -55,17 +91,18 @@ class DataManager:
         Get attribute value.
 
         When trying to get value from outdated attribute warning is raised about
-        it being deprecated and the new variable is used instead.
+        it being deprecated and the new variable is used instead. The warning
+        is only raised the first time each attribute is used.
 
         Returns:
             data stored in the new location
 
         """
         if attr in ["device_list"]:
-            warnings.warn("Property {} is deprecated".format(attr))
+            warn_deprecated(attr)
             return self.network.devices
         if attr in ["network_cl"]:
-            warnings.warn("Property {} is deprecated".format(attr))
+            warn_deprecated(attr)
             return self.network
 
     def get_latest_instance(self):
@@ -78,17 +115,20 @@ class DataManager:
             name of the most recently changed file
 
         """
-        path = os.path.join(self.path_to_calling_file, 'saved_instances')
-        os.makedirs(path, exist_ok=True)
-
-        file_paths = []
-        for file_name in os.listdir(path):
-            file_paths.append(os.path.join(path, file_name))
+        with os.scandir(self.saved_instances_path) as entries:
+            latest_entry = max(
+                (
+                    entry for entry in entries
+                    if entry.is_file() and not entry.name.endswith(TEMP_SUFFIX)
+                ),
+                key=lambda entry: entry.stat().st_ctime,
+                default=None
+            )
 
         latest_file = None
-        if len(file_paths) > 0:
-            latest_file = str(max(file_paths, key=os.path.getctime))
-            self.wapp_log.debug('Latest file: {}'.format(latest_file))
+        if latest_entry is not None:
+            latest_file = latest_entry.path
+            self.wapp_log.debug('Latest file: %s', latest_file)
 
         return latest_file
 
@@ -100,10 +140,10 @@ class DataManager:
 
         """
         try:
-            with open(self.json_file_name) as data_file:
+            with open(self.json_file_name, 'rb') as data_file:
                 file_data = data_file.read()
                 self.parse_json_file(file_data)
-            self.wapp_log.debug("Opening file: {}".format(self.json_file_name))
+            self.wapp_log.debug("Opening file: %s", self.json_file_name)
         except FileNotFoundError as fnfe:
             self.wapp_log.error("Error finding file: {}".format(fnfe))
             raise fnfe
@@ -116,19 +156,19 @@ class DataManager:
         results of which are saved in network variable.
 
         Args:
-            file_data: string data read from the file.
+            file_data: string or bytes data read from the file.
 
         """
         try:
-            self.decoded = json.loads(file_data)
+            self.decoded = json_loads(file_data)
             json_container = self.decoded.get('data')
-            if not isinstance(json_container, dict):
-                json_container = json.loads(json_container)
+            if isinstance(json_container, (str, bytes)):
+                json_container = json_loads(json_container)
         except json.JSONDecodeError as jde:
             self.wapp_log.error("Error decoding: {}".format(jde))
             raise jde
 
-        self.wapp_log.debug("RAW JSON DATA:\n\n{}\n\n".format(json_container))
+        self.wapp_log.debug("RAW JSON DATA:\n\n%s\n\n", json_container)
 
         self.network = self.wappsto_decoder.decode_network(json_container, self)
 
@@ -137,62 +177,107 @@ class DataManager:
         Saves current instance of the whole network.
 
         Encodes the whole network and saves it in the saved instance folder.
+        The file is replaced atomically.
 
         """
-        encoded_string = str(self.get_encoded_network())
-        encoded_string = encoded_string.replace("\'", "\\\"")
-        encoded_string = '{{"data":"{}"}}'.format(encoded_string)
+        encoded_data = json_dumps({"data": self.get_encoded_network()})
 
-        path = os.path.join(self.path_to_calling_file, 'saved_instances')
-        os.makedirs(path, exist_ok=True)
         json_base_name = os.path.basename(self.json_file_name)
-        path_open = os.path.join(path, json_base_name)
+        path_open = os.path.join(self.saved_instances_path, json_base_name)
 
-        with open(path_open, "w+") as network_file:
-            network_file.write(encoded_string)
+        # NOTE: Write to a temporary file and rename it over the old one, so
+        #       a crash during the write never leaves a truncated instance.
+        path_temp = path_open + TEMP_SUFFIX
+        with open(path_temp, "wb") as network_file:
+            network_file.write(encoded_data)
+        os.replace(path_temp, path_open)
 
-        msg = "Saved {} to {}".format(encoded_string, network_file)
-        self.wapp_log.debug(msg)
+        self.wapp_log.debug("Saved %s to %s", encoded_data, path_open)
 
-    def get_by_id(self, id):
+    def build_id_index(self, network):
         """
-        Wappsto get by id.
+        Build id index.
 
-        Retrieves the instance of a class if its id matches the provided one.
+        Builds the index used by get_by_id, mapping the uuid of each object
+        in the network to the name of its kind and the instance itself. If
+        uuids are repeated, the first object found is kept.
 
         Args:
-            id: unique identifier used for searching
+            network: Reference to the instance of the Network class.
 
         Returns:
-            A reference to the network/device/value/state object instance.
+            The IdIndex of the network.
 
         """
-        # UNSURE(MBK): I feel that there is a more pythonic way of doing this.
-        message = "Found instance of {} object with id: {}"
-        if self.network is not None:
-            if self.network.uuid == id:
-                self.wapp_log.debug(message.format("network", id))
-                return self.network
+        objects = {}
+        if network is not None:
+            objects.setdefault(network.uuid, ("network", network))
+            for device in network.devices:
+                objects.setdefault(device.uuid, ("device", device))
+                for value in device.values:
+                    objects.setdefault(value.uuid, ("value", value))
+                    if value.control_state is not None:
+                        objects.setdefault(value.control_state.uuid, ("control state", value.control_state))
+                    if value.report_state is not None:
+                        objects.setdefault(value.report_state.uuid, ("report state", value.report_state))
+        return IdIndex(network, objects)
+
+    def __is_current(self, id, found, network):
+        # NOTE: The lists of the network are public and uuids can be
+        #       changed directly, so make sure the object is still in the
+        #       network under this id.
+        if found is None or found[1].uuid != id:
+            return False
+        kind, obj = found
+        if kind == "network":
+            return obj is network
+        if kind in ("control state", "report state"):
+            value = obj.parent
+            if obj is not value.control_state and obj is not value.report_state:
+                return False
+            obj = value
+        if kind != "device":
+            device = obj.parent
+            if not any(value is obj for value in device.values):
+                return False
+            obj = device
+        return any(device is obj for device in network.devices)
 
-            for device in self.network.devices:
-                if device.uuid == id:
-                    self.wapp_log.debug(message.format("device", id))
-                    return device
+    def get_by_id(self, id):
+        """
+        Wappsto get by id.
 
-                for value in device.values:
-                    if value.uuid == id:
-                        self.wapp_log.debug(message.format("value", id))
-                        return value
+        Retrieves the instance of a class if its id matches the provided one.
+        The id index is built on the first lookup and rebuilt when the
+        network is replaced, or when the id is not found in it.
 
-                    if value.control_state is not None and value.control_state.uuid == id:
-                        self.wapp_log.debug(message.format("control state", id))
-                        return value.control_state
+        Args:
+            id: unique identifier used for searching
 
-                    if value.report_state is not None and value.report_state.uuid == id:
-                        self.wapp_log.debug(message.format("report state", id))
-                        return value.report_state
+        Returns:
+            A reference to the network/device/value/state object instance.
 
-        self.wapp_log.warning("Failed to find object with id: {}".format(id))
+        """
+        # NOTE: Read into locals, as another thread may replace the index
+        #       between the check and the lookup.
+        network = self.network
+        id_index = self.id_index
+        rebuilt = id_index is None or id_index.network is not network
+        if rebuilt:
+            id_index = self.build_id_index(network)
+            self.id_index = id_index
+
+        found = id_index.objects.get(id)
+        if not rebuilt and not self.__is_current(id, found, network):
+            id_index = self.build_id_index(network)
+            self.id_index = id_index
+            found = id_index.objects.get(id)
+
+        if found is not None:
+            self.wapp_log.debug("Found instance of %s object with id: %s", found[0], id)
+            return found[1]
+
+        self.wapp_log.warning("Failed to find object with id: %s", id)
 
     def get_encoded_network(self):
         """
@@ -4,11 +4,79 @@ The wappsto decoding module.
 Handles decoding object instances from a JSON file.
 """
 import logging
+import sys
 from ..modules import network as network_module
 from ..modules import device as device_module
 from ..modules import value as value_module
 from ..modules import state as state_module
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+
+
+def intern_string(data):
+    """
+    Intern the data if it is a string.
+
+    Used for the enum-like fields that repeats on every value and state,
+    so all objects share one copy of each string.
+
+    Args:
+        data: The decoded JSON value.
+
+    Returns:
+        The interned string, or data unchanged if it is not a string.
+
+    """
+    if isinstance(data, str):
+        return sys.intern(data)
+    return data
+
+
+# NOTE: Value takes the details of every data type, so each decoder starts
+#       from these and only fills in its own.
+NO_DETAILS = dict.fromkeys((
+    'number_min', 'number_max', 'number_step', 'number_unit',
+    'string_encoding', 'string_max',
+    'blob_encoding', 'blob_max'
+))
+
+
+def decode_string_details(details):
+    """Return the Value arguments for the 'string' details of a value."""
+    return dict(
+        NO_DETAILS,
+        string_encoding=intern_string(details.get('encoding')),
+        string_max=details.get('max')
+    )
+
+
+def decode_blob_details(details):
+    """Return the Value arguments for the 'blob' details of a value."""
+    return dict(
+        NO_DETAILS,
+        blob_encoding=intern_string(details.get('encoding')),
+        blob_max=details.get('max')
+    )
+
+
+def decode_number_details(details):
+    """Return the Value arguments for the 'number' details of a value."""
+    return dict(
+        NO_DETAILS,
+        number_min=details.get('min'),
+        number_max=details.get('max'),
+        number_step=details.get('step'),
+        number_unit=intern_string(details.get('unit'))
+    )
+
+
+DETAILS_DECODERS = {
+    'string': decode_string_details,
+    'blob': decode_blob_details,
+    'number': decode_number_details
+}
+
 
 class WappstoDecoder:
     """
@@ -24,8 +92,7 @@ class WappstoDecoder:
 
         Initializes the WappstoDecoder class.
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
 
     def decode_network(self, json_data, data_manager):
         """
@@ -42,16 +109,17 @@ class WappstoDecoder:
             Network object.
 
         """
+        meta = json_data['meta']
         network = network_module.Network(
-            uuid=json_data.get('meta').get('id'),
-            version=json_data.get('meta').get('version'),  # TODO (aeb): Remove? Does not make much sense
+            uuid=meta.get('id'),
+            version=meta.get('version'),  # TODO (aeb): Remove? Does not make much sense
             name=json_data.get('name'),
             devices=[],
             data_manager=data_manager
         )
         network.devices = self.decode_device(json_data, network)
 
-        self.wapp_log.debug("Network {} built.".format(network))
+        self.wapp_log.debug("Network %s built.", network)
         return network
 
     def decode_device(self, json_data, parent):
@@ -73,7 +141,7 @@ class WappstoDecoder:
         for device_iterator in json_data.get('device', []):
             device = device_module.Device(
                 parent=parent,
-                uuid=device_iterator.get('meta').get('id'),
+                uuid=device_iterator['meta'].get('id'),
                 name=device_iterator.get('name'),
                 product=device_iterator.get('product'),
                 protocol=device_iterator.get('protocol'),
@@ -86,8 +154,7 @@ class WappstoDecoder:
             device.values = self.decode_value(device_iterator, device)
             devices.append(device)
 
-            msg = "Device {} appended to {}".format(device, devices)
-            self.wapp_log.debug(msg)
+            self.wapp_log.debug("Device %s appended to %s", device, devices)
         return devices
 
     def decode_value(self, json_data, parent):
@@ -107,48 +174,25 @@ class WappstoDecoder:
         """
         values = []
         for value_iterator in json_data.get('value', []):
-            data_type = None
-            number_min = None
-            number_max = None
-            number_step = None
-            number_unit = None
-            string_encoding = None
-            string_max = None
-            blob_encoding = None
-            blob_max = None
-
-            if 'string' in value_iterator:
-                data_type = 'string'
-                string_encoding = value_iterator.get('string').get('encoding')
-                string_max = value_iterator.get('string').get('max')
-            elif 'blob' in value_iterator:
-                data_type = 'blob'
-                blob_encoding = value_iterator.get('blob').get('encoding')
-                blob_max = value_iterator.get('blob').get('max')
-            elif 'number' in value_iterator:
-                data_type = 'number'
-                number_min = value_iterator.get('number').get('min')
-                number_max = value_iterator.get('number').get('max')
-                number_step = value_iterator.get('number').get('step')
-                number_unit = value_iterator.get('number').get('unit')
+            for data_type, decode_details in DETAILS_DECODERS.items():
+                details = value_iterator.get(data_type)
+                if details is not None:
+                    details = decode_details(details)
+                    break
+            else:
+                data_type = None
+                details = NO_DETAILS
 
             value = value_module.Value(
                 parent=parent,
-                uuid=value_iterator.get('meta').get('id'),
+                uuid=value_iterator['meta'].get('id'),
                 name=value_iterator.get('name'),
-                type_of_value=value_iterator.get('type'),
+                type_of_value=intern_string(value_iterator.get('type')),
                 data_type=data_type,
-                permission=value_iterator.get('permission'),
-                number_max=number_max,
-                number_min=number_min,
-                number_step=number_step,
-                number_unit=number_unit,
-                string_encoding=string_encoding,
-                string_max=string_max,
-                blob_encoding=blob_encoding,
-                blob_max=blob_max,
+                permission=intern_string(value_iterator.get('permission')),
                 period=value_iterator.get('period', None),
-                delta=value_iterator.get('delta', None)
+                delta=value_iterator.get('delta', None),
+                **details
             )
             for state in self.decode_state(value_iterator, value):
                 if state.state_type == 'Report':
@@ -157,8 +201,7 @@ class WappstoDecoder:
                     value.add_control_state(state)
             values.append(value)
 
-            msg = "Value {} appended to {}".format(value, values)
-            self.wapp_log.debug(msg)
+            self.wapp_log.debug("Value %s appended to %s", value, values)
         return values
 
     def decode_state(self, json_data, parent):
@@ -176,14 +219,13 @@ class WappstoDecoder:
             List of states.
 
         """
-        states = []
-        for state_iterator in json_data.get('state', []):
-            state = state_module.State(
+        return [
+            state_module.State(
                 parent=parent,
-                uuid=state_iterator.get('meta').get('id'),
-                state_type=state_iterator.get('type'),
+                uuid=state_iterator['meta'].get('id'),
+                state_type=intern_string(state_iterator.get('type')),
                 timestamp=state_iterator.get('timestamp'),
                 init_value=state_iterator.get('data')
             )
-            states.append(state)
-        return states
+            for state_iterator in json_data.get('state', [])
+        ]
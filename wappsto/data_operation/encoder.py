@@ -6,6 +6,42 @@ Handles encoding object instances to a JSON file.
 import logging
 from ..connection import seluxit_rpc
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+
+
+def encode_string_details(value):
+    """Return the 'string' details of a string value."""
+    return {
+        'encoding': value.string_encoding,
+        'max': value.string_max
+    }
+
+
+def encode_blob_details(value):
+    """Return the 'blob' details of a blob value."""
+    return {
+        'encoding': value.blob_encoding,
+        'max': value.blob_max
+    }
+
+
+def encode_number_details(value):
+    """Return the 'number' details of a number value."""
+    return {
+        'min': value.number_min,
+        'max': value.number_max,
+        'step': value.number_step,
+        'unit': value.number_unit
+    }
+
+
+DETAILS_ENCODERS = {
+    'string': encode_string_details,
+    'blob': encode_blob_details,
+    'number': encode_number_details
+}
+
 
 class WappstoEncoder:
     """
@@ -22,8 +58,7 @@ class WappstoEncoder:
 
         Initializes the WappstoEncoder class.
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
 
     def encode_network(self, network):
         """
@@ -39,14 +74,9 @@ class WappstoEncoder:
             The dictionary.
 
         """
-        encoded_devices = []
-        for device in network.devices:
-            encoded_device = self.encode_device(device)
-            encoded_devices.append(encoded_device)
-
         encoded_network = {
             'name': network.name,
-            'device': encoded_devices,
+            'device': [self.encode_device(device) for device in network.devices],
             'meta': {
                 'id': network.uuid,
                 'version': '2.0',
@@ -55,9 +85,9 @@ class WappstoEncoder:
         }
 
         if seluxit_rpc.is_upgradable():
-            encoded_network.get('meta').update({'upgradable': True})
+            encoded_network['meta']['upgradable'] = True
 
-        self.wapp_log.debug("Network JSON: {}".format(encoded_network))
+        self.wapp_log.debug("Network JSON: %s", encoded_network)
         return encoded_network
 
     def encode_device(self, device):
@@ -74,11 +104,6 @@ class WappstoEncoder:
             The dictionary.
 
         """
-        encoded_values = []
-        for value in device.values:
-            encoded_value = self.encode_value(value)
-            encoded_values.append(encoded_value)
-
         encoded_device = {
             'name': device.name,
             'product': device.product,
@@ -88,7 +113,7 @@ class WappstoEncoder:
             'communication': device.communication,
             'description': device.description,
             'version': device.version,
-            'value': encoded_values,
+            'value': [self.encode_value(value) for value in device.values],
             'meta':
             {
                 'id': device.uuid,
@@ -97,7 +122,7 @@ class WappstoEncoder:
             }
         }
 
-        self.wapp_log.debug("Device JSON: {}".format(encoded_device))
+        self.wapp_log.debug("Device JSON: %s", encoded_device)
         return encoded_device
 
     def encode_value(self, value):
@@ -114,52 +139,30 @@ class WappstoEncoder:
             The dictionary.
 
         """
-        states = []
-        if value.report_state:
-            encoded_state = self.encode_state(
-                value.report_state
-            )
-            states.append(encoded_state)
-
-        if value.control_state:
-            encoded_state = self.encode_state(
-                value.control_state
-            )
-            states.append(encoded_state)
-
-        if value.data_type == 'string':
-            details = {
-                'encoding': value.string_encoding,
-                'max': value.string_max
-            }
-        elif value.data_type == 'blob':
-            details = {
-                'encoding': value.blob_encoding,
-                'max': value.blob_max
-            }
-        elif value.data_type == 'number':
-            details = {
-                'min': value.number_min,
-                'max': value.number_max,
-                'step': value.number_step,
-                'unit': value.number_unit
-            }
-
         encoded_value = {
             'name': value.name,
             'type': value.type_of_value,
             'permission': value.permission,
-            'state': states,
-            value.data_type: details,
-            'meta':
-            {
-                'id': value.uuid,
-                'type': 'value',
-                'version': '2.0'
-            }
+            'state': [
+                self.encode_state(state)
+                for state in (value.report_state, value.control_state)
+                if state
+            ]
+        }
+
+        encode_details = DETAILS_ENCODERS.get(value.data_type)
+        if encode_details is not None:
+            encoded_value[value.data_type] = encode_details(value)
+        else:
+            self.wapp_log.warning("Value type '%s' is invalid", value.data_type)
+
+        encoded_value['meta'] = {
+            'id': value.uuid,
+            'type': 'value',
+            'version': '2.0'
         }
 
-        self.wapp_log.debug("Value JSON: {}".format(encoded_value))
+        self.wapp_log.debug("Value JSON: %s", encoded_value)
         return encoded_value
 
     def encode_state(self, state):
@@ -189,5 +192,5 @@ class WappstoEncoder:
             }
         }
 
-        self.wapp_log.debug("State JSON: {}".format(encoded_state))
+        self.wapp_log.debug("State JSON: %s", encoded_state)
         return encoded_state
@@ -9,6 +9,9 @@ import warnings
 from ..connection import message_data
 from ..errors import wappsto_errors
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+
 
 class Device:
     """
@@ -49,8 +52,7 @@ class Device:
             description: Description of a device
 
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
         self.parent = parent
         self.uuid = uuid
         self.name = name
@@ -63,8 +65,8 @@ class Device:
         self.description = description
         self.values = []
         self.callback = None
-        msg = "Device {} Debug: \n {}".format(name, str(self.__dict__))
-        self.wapp_log.debug(msg)
+        if self.wapp_log.isEnabledFor(logging.DEBUG):
+            self.wapp_log.debug("Device %s Debug: \n %s", name, self.__dict__)
 
     def __getattr__(self, attr):  # pragma: no cover
         """
@@ -104,8 +106,13 @@ class Device:
             value: Reference to instance of Value class.
 
         """
-        self.values.append(value)
-        self.wapp_log.debug("Value {} has been added.".format(value))
+        # NOTE: The device and value lists are rebound instead of mutated,
+        #       here and in Device.delete and Value.delete, so threads
+        #       currently iterating over the old list keep a consistent
+        #       snapshot. A list fetched earlier, from get_devices() or
+        #       device.values, does therefore not reflect later changes.
+        self.values = self.values + [value]
+        self.wapp_log.debug("Value %s has been added.", value)
 
     def get_value(self, value_name):
         """
@@ -176,7 +183,9 @@ class Device:
             device_id=self.uuid
         )
         self.parent.conn.sending_queue.put(message)
-        self.parent.devices.remove(self)
+        self.parent.devices = [
+            device for device in self.parent.devices if device is not self
+        ]
         self.wapp_log.info("Device removed")
 
     def __call_callback(self, event):
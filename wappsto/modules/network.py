@@ -8,6 +8,9 @@ import logging
 from ..connection import message_data
 from ..errors import wappsto_errors
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+
 
 class Network:
     """
@@ -30,8 +33,7 @@ class Network:
             data_manager: Instance of DataManager
 
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
         self.uuid = uuid
         self.version = version
         self.name = name
@@ -39,8 +41,8 @@ class Network:
         self.data_manager = data_manager
         self.conn = None
         self.callback = None
-        msg = "Network {} Debug \n{}".format(name, str(self.__dict__))
-        self.wapp_log.debug(msg)
+        if self.wapp_log.isEnabledFor(logging.DEBUG):
+            self.wapp_log.debug("Network %s Debug \n%s", name, self.__dict__)
 
     def set_callback(self, callback):
         """
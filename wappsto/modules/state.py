@@ -7,6 +7,9 @@ import logging
 from ..connection import message_data
 from ..errors import wappsto_errors
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+
 
 class State:
     """
@@ -15,6 +18,17 @@ class State:
     Stores attributes for the state instance and handles device-related
     """
 
+    __slots__ = (
+        'wapp_log',
+        'parent',
+        'uuid',
+        'state_type',
+        'timestamp',
+        'callback',
+        'init_value',
+        'data'
+    )
+
     def __init__(self, parent, uuid, state_type, timestamp, init_value):
         """
         Initialize the State class.
@@ -30,8 +44,7 @@ class State:
             init_value: Initial value after creation of an object
 
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
         self.parent = parent
         self.uuid = uuid
         self.state_type = state_type
@@ -41,8 +54,10 @@ class State:
         self.init_value = init_value
         self.data = init_value
 
-        msg = "State {} Debug: \n{}".format(uuid, str(self.__dict__))
-        self.wapp_log.debug(msg)
+        if self.wapp_log.isEnabledFor(logging.DEBUG):
+            self.wapp_log.debug("State %s Debug: \n%s", uuid, {
+                attr: getattr(self, attr) for attr in self.__slots__
+            })
 
     def get_parent_value(self):  # pragma: no cover
         """
@@ -5,19 +5,121 @@ Stores attributes for the value instance and handles value-related
 methods.
 """
 import logging
+import sched
 import threading
+import time
 import warnings
 
 from ..connection import message_data
 from ..connection import seluxit_rpc
 from ..errors import wappsto_errors
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+
+INVALID_STEP = 1
+OUTSIDE_RANGE = 2
+
+DEPRECATED_ATTRIBUTES = frozenset(["last_controlled"])
+
+NUMBER_TYPE = 0
+STRING_TYPE = 1
+BLOB_TYPE = 2
+DATA_TYPES = {
+    "number": NUMBER_TYPE,
+    "string": STRING_TYPE,
+    "blob": BLOB_TYPE
+}
+
 
 def isNaN(num):
     """Test if input is a float 'NaN' value."""
     return num != num
 
 
+def data_length(data_value):
+    """Return the length of the data value, as it will be sent."""
+    if isinstance(data_value, str):
+        return len(data_value)
+    return len(str(data_value))
+
+
+class PeriodScheduler:
+    """
+    Period scheduler.
+
+    Runs the period timers of all the values from a single shared thread,
+    instead of a thread per value.
+    """
+
+    def __init__(self):
+        """
+        Initialize the PeriodScheduler class.
+
+        The scheduler thread is first started, when the first timer is set,
+        and restarted by the next timer, should it ever have stopped.
+        """
+        self.wakeup = threading.Event()
+        self.scheduler = sched.scheduler(time.monotonic, self.__delay)
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def __delay(self, timeout):
+        # NOTE: Returns early if a new timer was set, so the scheduler can
+        #       check if it is due before the one it is waiting for.
+        self.wakeup.wait(timeout)
+        self.wakeup.clear()
+
+    def __run(self):
+        while True:
+            try:
+                self.scheduler.run()
+            except Exception:
+                # NOTE: A failing action must not stop the timers of the
+                #       other values, so log it and keep running.
+                _log.exception("Period timer action failed.")
+                continue
+            self.wakeup.wait()
+            self.wakeup.clear()
+
+    def enter(self, delay, action):
+        """
+        Set a timer.
+
+        Args:
+            delay: Time in seconds before the action is called.
+            action: Callable to call when the timer is done.
+
+        Returns:
+            The timer event, to be used with cancel.
+
+        """
+        event = self.scheduler.enter(delay, 1, action)
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.__run, daemon=True)
+                self.thread.start()
+        self.wakeup.set()
+        return event
+
+    def cancel(self, event):
+        """
+        Cancel a timer.
+
+        Args:
+            event: The timer event returned by enter.
+
+        """
+        try:
+            self.scheduler.cancel(event)
+        except ValueError:
+            # NOTE: The timer is already done.
+            pass
+
+
+period_scheduler = PeriodScheduler()
+
+
 class Value:
     """
     Value instance.
@@ -26,6 +128,35 @@ class Value:
     methods.
     """
 
+    __slots__ = (
+        'wapp_log',
+        'parent',
+        'uuid',
+        'name',
+        'type_of_value',
+        '_data_type',
+        '_type_tag',
+        'permission',
+        'number_max',
+        '_number_min',
+        '_number_step',
+        'number_unit',
+        'string_encoding',
+        '_string_max',
+        'blob_encoding',
+        '_blob_max',
+        'report_state',
+        '_report_ids',
+        'control_state',
+        'callback',
+        'timer',
+        'timer_elapsed',
+        'last_update_of_report',
+        'period',
+        'delta',
+        '_step_is_int'
+    )
+
     def __init__(
         self,
         parent,
@@ -74,31 +205,37 @@ class Value:
             delta: defines the a difference of value (default: {None})
 
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
         self.parent = parent
         self.uuid = uuid
         self.name = name
         self.type_of_value = type_of_value
-        self.data_type = data_type
+        self._data_type = data_type
+        self._type_tag = DATA_TYPES.get(data_type)
         self.permission = permission
         # The value shared between state instances.
         self.number_max = number_max
-        self.number_min = number_min
-        self.number_step = number_step
+        self._number_min = number_min
+        self._number_step = number_step
         self.number_unit = number_unit
         self.string_encoding = string_encoding
         self.string_max = string_max
         self.blob_encoding = blob_encoding
         self.blob_max = blob_max
         self.report_state = None
+        self._report_ids = None
         self.control_state = None
         self.callback = None
 
-        self.timer = threading.Timer(None, None)
+        self.timer = None
+        self.timer_elapsed = False
         self.last_update_of_report = None
+        self.period = None
+        self.delta = None
 
-        # if self._invalid_step(self.number_max):
+        self.__set_step_check()
+
+        # if self._check_number(self.number_max) & INVALID_STEP:
         #     msg = "Inconsistent max, min & step provided. "
         #     msg += "'(max-min)/step' do not appear to an integer-like."
         #     self.wapp_log.warning(msg)
@@ -108,8 +245,75 @@ class Value:
         if delta:
             self.set_delta(delta)
 
-        msg = "Value {} debug: {}".format(name, str(self.__dict__))
-        self.wapp_log.debug(msg)
+        if self.wapp_log.isEnabledFor(logging.DEBUG):
+            self.wapp_log.debug("Value %s debug: %s", name, {
+                attr: getattr(self, attr) for attr in self.__slots__
+            })
+
+    @property
+    def data_type(self):
+        """Defines whether a value is string, blob or number."""
+        return self._data_type
+
+    @data_type.setter
+    def data_type(self, data_type):
+        self._data_type = data_type
+        self._type_tag = DATA_TYPES.get(data_type)
+        self.__set_step_check()
+
+    @property
+    def string_max(self):
+        """Maximum length of string, as an integer."""
+        return self._string_max
+
+    @string_max.setter
+    def string_max(self, string_max):
+        self._string_max = int(string_max) if string_max is not None else None
+
+    @property
+    def blob_max(self):
+        """Maximum length of a blob, as an integer."""
+        return self._blob_max
+
+    @blob_max.setter
+    def blob_max(self, blob_max):
+        self._blob_max = int(blob_max) if blob_max is not None else None
+
+    @property
+    def number_min(self):
+        """Minimum number a value can have."""
+        return self._number_min
+
+    @number_min.setter
+    def number_min(self, number_min):
+        self._number_min = number_min
+        self.__set_step_check()
+
+    @property
+    def number_step(self):
+        """Number defining a step."""
+        return self._number_step
+
+    @number_step.setter
+    def number_step(self, number_step):
+        self._number_step = number_step
+        self.__set_step_check()
+
+    def __set_step_check(self):
+        """
+        Select the step size check matching number_min and number_step.
+
+        Integral min & step (the common sensor case) are checked with a
+        modulo first. Called again whenever data_type, number_min or
+        number_step is set.
+        """
+        self._step_is_int = (
+            self._type_tag == NUMBER_TYPE
+            and self.number_min is not None
+            and self.number_step is not None
+            and float(self.number_min).is_integer()
+            and float(self.number_step).is_integer()
+        )
 
     def __getattr__(self, attr):  # pragma: no cover
         """
@@ -121,10 +325,16 @@ class Value:
         Returns:
             value of get_data
 
+        Raises:
+            AttributeError: If the attribute do not exist.
+
         """
-        if attr in ["last_controlled"]:
+        if attr in DEPRECATED_ATTRIBUTES:
             warnings.warn("Property {} is deprecated".format(attr))
             return self.get_control_state().data
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, attr)
+        )
 
     def set_period(self, period):
         """
@@ -176,17 +386,35 @@ class Value:
         Stop previous timer and sets new one if period value is not None.
 
         """
-        self.timer.cancel()
+        if self.timer is not None:
+            period_scheduler.cancel(self.timer)
+            self.timer = None
         if self.period is not None:
             self.timer_elapsed = False
-            self.timer = threading.Timer(self.period, self.__timer_done)
-            self.timer.start()
+            self.timer = period_scheduler.enter(self.period, self.__timer_done)
 
     def __timer_done(self):
+        self.timer = None
         self.__set_timer()
         self.timer_elapsed = True
         # self.handle_refresh()  # ERROR: Trickered double sampling. Text needed.
 
+    def disable_period(self):
+        """
+        Disable the Period handling.
+
+        Stops the timer, so the value are no longer getting updated with
+        the Periods, until it is set again.
+        """
+        if self.timer is None:
+            return
+        period_scheduler.cancel(self.timer)
+        self.timer = None
+        self.wapp_log.debug(
+            "Value: %s is no longer periodically sending updates.",
+            self.uuid
+        )
+
     def set_delta(self, delta):
         """
         Set the delta to report between.
@@ -212,7 +440,7 @@ class Value:
             self.wapp_log.warning("Delta value must not be lower then 0.")
             return
 
-        if self.__is_number_type():
+        if self._type_tag == NUMBER_TYPE:
             self.delta = delta
 
     def enable_delta(self):
@@ -253,10 +481,10 @@ class Value:
 
         """
         self.report_state = state
-        msg = "Report state {} has been added.".format(state.parent.name)
+        self._report_ids = None
         self.enable_period()
         self.enable_delta()
-        self.wapp_log.debug(msg)
+        self.wapp_log.debug("Report state %s has been added.", state.parent.name)
 
     def add_control_state(self, state):
         """
@@ -269,8 +497,7 @@ class Value:
 
         """
         self.control_state = state
-        msg = "Control state {} has been added".format(state.parent.name)
-        self.wapp_log.debug(msg)
+        self.wapp_log.debug("Control state %s has been added", state.parent.name)
 
     def get_report_state(self):
         """
@@ -285,8 +512,7 @@ class Value:
         if self.report_state is not None:
             return self.report_state
 
-        msg = "Value {} has no report state.".format(self.name)
-        self.wapp_log.warning(msg)
+        self.wapp_log.warning("Value %s has no report state.", self.name)
 
     def get_control_state(self):
         """
@@ -301,8 +527,7 @@ class Value:
         if self.control_state is not None:
             return self.control_state
 
-        msg = "Value {} has no control state.".format(self.name)
-        self.wapp_log.warning(msg)
+        self.wapp_log.warning("Value %s has no control state.", self.name)
 
     def set_callback(self, callback):
         """
@@ -320,10 +545,10 @@ class Value:
         """
         if not callable(callback):
             msg = "Callback method should be a method"
-            self.wapp_log.error("Error setting callback: {}".format(msg))
+            self.wapp_log.error("Error setting callback: %s", msg)
             raise wappsto_errors.CallbackNotCallableException
         self.callback = callback
-        self.wapp_log.debug("Callback {} has been set.".format(callback))
+        self.wapp_log.debug("Callback %s has been set.", callback)
         return True
 
     def _validate_value_data(self, data_value, err_msg=None):
@@ -331,9 +556,13 @@ class Value:
         #            control validation, in 'receive_Data/incoming_put'
         if err_msg is None:
             err_msg = []
-        if self.__is_number_type():
+        if self._type_tag == NUMBER_TYPE:
             try:
-                if self._outside_range(data_value):
+                data_float = float(data_value)
+                if isNaN(data_float):
+                    raise ValueError("Value is NAN!")
+                check = self._check_number(data_float)
+                if check & OUTSIDE_RANGE:
                     msg = "Invalid number. Range: {}-{}. Yours is: {}".format(
                         self.number_min,
                         self.number_max,
@@ -341,7 +570,7 @@ class Value:
                     )
                     err_msg.append(msg)
                     self.wapp_log.warning(msg)
-                if self._invalid_step(data_value):
+                if check & INVALID_STEP:
                     msg = "Invalid Step. Step: {}. Min: {}. Value: {}".format(
                         self.number_step,
                         self.number_min,
@@ -357,11 +586,8 @@ class Value:
                 self.wapp_log.error(msg)
                 return "NA"
 
-        elif self.__is_string_type():
-            if self.string_max is None:
-                return data_value
-
-            if len(str(data_value)) <= int(self.string_max):
+        elif self._type_tag == STRING_TYPE:
+            if self.string_max is None or data_length(data_value) <= self.string_max:
                 return data_value
 
             msg = "Value for '{}' not in correct range: {}."
@@ -369,11 +595,8 @@ class Value:
             err_msg.append(msg)
             self.wapp_log.warning(msg)
 
-        elif self.__is_blob_type():
-            if self.blob_max is None:
-                return data_value
-
-            if len(str(data_value)) <= int(self.blob_max):
+        elif self._type_tag == BLOB_TYPE:
+            if self.blob_max is None or data_length(data_value) <= self.blob_max:
                 return data_value
 
             msg = "Value for '{}' not in correct range: {}."
@@ -382,36 +605,40 @@ class Value:
             self.wapp_log.warning(msg)
 
         else:
-            msg = "Value type '{}' is invalid".format(self.date_type)
+            msg = "Value type '{}' is invalid".format(self.data_type)
             err_msg.append(msg)
             self.wapp_log.error(msg)
 
-    def _outside_range(self, value):
+    def _check_number(self, value):
         """
-        Check weather or not the value are outside range.
+        Check the value against the range and step size in one pass.
 
         Args:
-            value: The value to be checked.
+            value: The value to be checked, as a float.
 
         Returns:
-            True, if outside range.
-            False if inside range.
+            A bit mask, with OUTSIDE_RANGE set if the value is outside
+            range and INVALID_STEP set if it is an invalid step size.
+            0 if the value is valid.
         """
-        return not (self.number_min <= float(value) <= self.number_max)
+        outside = not (self.number_min <= value <= self.number_max)
+        return (outside << 1) | self._invalid_step(value)
 
     def _invalid_step(self, value):
         """
         Check weather or not the value are invalid step size.
 
         Args:
-            value: The value to be checked.
+            value: The value to be checked, as a float.
 
         Returns:
             True, if invalid step size.
             False if valid step size.
         """
-        x = (float(value) - self.number_min) / self.number_step
-        return not (abs(round(x) - x) <= 1e-9)
+        if self._step_is_int and (value - self.number_min) % self.number_step == 0:
+            return False
+        x = (value - self.number_min) / self.number_step
+        return abs(round(x) - x) > 1e-9
 
     def update(self, data_value, timestamp=None):
         """
@@ -442,18 +669,71 @@ class Value:
 
         state.timestamp = timestamp
 
+        if self._report_ids is None:
+            # NOTE: Read on the first report, as the value may not be part
+            #       of a network yet when the report state is added.
+            self._report_ids = (
+                state.parent.parent.parent.uuid,
+                state.parent.parent.uuid,
+                state.parent.uuid,
+                state.uuid
+            )
+        network_id, device_id, value_id, state_id = self._report_ids
         msg = message_data.MessageData(
             message_data.SEND_REPORT,
             data=str(data_value),
-            network_id=state.parent.parent.parent.uuid,
-            device_id=state.parent.parent.uuid,
-            value_id=state.parent.uuid,
-            state_id=state.uuid,
+            network_id=network_id,
+            device_id=device_id,
+            value_id=value_id,
+            state_id=state_id,
             verb=message_data.PUT
         )
         # self.parent.parent.conn.send_data.send_report(msg)
         self.parent.parent.conn.sending_queue.put(msg)
 
+    def update_batch(self, data_values, timestamps=None):
+        """
+        Update value with a batch of samples.
+
+        Goes through the samples in order, and if a delta or period is set,
+        only sends the ones that passes the delta and period check.
+        Nothing is sent if the number of timestamps does not match the
+        number of values.
+
+        Args:
+            data_values: the new values, oldest first. Any iterable.
+            timestamps: time of action for each of the values.
+                (default: {None})
+
+        Returns:
+            The number of samples that was sent.
+
+        """
+        if self.get_report_state() is None:
+            self.wapp_log.warning("Value is write only.")
+            return 0
+
+        if timestamps is None:
+            samples = ((data_value, None) for data_value in data_values)
+        else:
+            data_values = list(data_values)
+            timestamps = list(timestamps)
+            if len(data_values) != len(timestamps):
+                self.wapp_log.error(
+                    "Got %s values but %s timestamps.",
+                    len(data_values),
+                    len(timestamps)
+                )
+                return 0
+            samples = zip(data_values, timestamps)
+
+        send_count = 0
+        for data_value, timestamp in samples:
+            if self.check_delta_and_period(data_value):
+                self.update(data_value, timestamp)
+                send_count += 1
+        return send_count
+
     def _update_delta_period_values(self, data_value):
         if self.period is not None:
             self.__set_timer()
@@ -469,6 +749,7 @@ class Value:
 
         Check if value has delta or period, if it has then if it passes
         checks then True is returned, otherwise False is returned.
+        If neither delta nor period is set, True is returned.
 
         Args:
             data_value: the new value.
@@ -477,6 +758,9 @@ class Value:
             True/False indicating the result of operation.
 
         """
+        if self.delta is None and self.period is None:
+            return True
+
         if self.delta is not None:
             try:
                 if isNaN(data_value):
@@ -485,15 +769,14 @@ class Value:
             except ValueError:
                 if not isNaN(self.last_update_of_report):
                     return True
-                return self.check_period(False)
-
-            if (
-                self.last_update_of_report is None
-                or not (abs(data_value - self.last_update_of_report) < self.delta)
-            ):
-                return True
+            else:
+                if (
+                    self.last_update_of_report is None
+                    or not (abs(data_value - self.last_update_of_report) < self.delta)
+                ):
+                    return True
 
-        return self.check_period(False)
+        return self.period is not None and self.timer_elapsed
 
     def check_period(self, return_value):
         """
@@ -569,7 +852,9 @@ class Value:
             value_id=self.uuid
         )
         self.parent.parent.conn.sending_queue.put(message)
-        self.parent.values.remove(self)
+        self.parent.values = [
+            value for value in self.parent.values if value is not self
+        ]
         self.wapp_log.info("Value removed")
 
     def __call_callback(self, event):
@@ -594,42 +879,3 @@ class Value:
         self.control_state.data = data_value
 
         return self.__call_callback('set')
-
-    def __is_number_type(self):
-        """
-        Validate data type.
-
-        Checks whether the type of the value is number.
-
-        Returns:
-        True if the type is number otherwise false.
-        boolean
-
-        """
-        return self.data_type == "number"
-
-    def __is_string_type(self):
-        """
-        Validate data type.
-
-        Checks whether the type of the value is string.
-
-        Returns:
-        True if the type is string otherwise false.
-        boolean
-
-        """
-        return self.data_type == "string"
-
-    def __is_blob_type(self):
-        """
-        Validate data type.
-
-        Checks whether the type of the value is blob.
-
-        Returns:
-        True if the type is blob otherwise false.
-        boolean
-
-        """
-        return self.data_type == "blob"
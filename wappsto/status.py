@@ -18,6 +18,8 @@ Attributes:
 import logging
 from .errors import wappsto_errors
 
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
 
 STARTING = "Starting"
 CONNECTING = "Connecting"
@@ -45,8 +47,7 @@ class Status:
         status flag.
 
         """
-        self.wapp_log = logging.getLogger(__name__)
-        self.wapp_log.addHandler(logging.NullHandler())
+        self.wapp_log = _log
         self.callback = None
         self.current_status = None
 